@@ -1,10 +1,14 @@
 import asyncio
 import contextlib
+import heapq
 import math
 import os
+import time
 from collections import defaultdict
 from datetime import timedelta
+from functools import lru_cache
 from itertools import chain
+from typing import Any
 
 import structlog
 from prometheus_client import Counter, Histogram
@@ -22,6 +26,7 @@ from annatar.torrent import Category, TorrentMeta
 log = structlog.get_logger(__name__)
 
 SEARCH_TIMEOUT = int(os.getenv("SEARCH_TIMEOUT") or 15)
+SEARCH_CACHE_SECONDS = int(os.getenv("SEARCH_CACHE_SECONDS") or 30)
 UNIQUE_SEARCHES: Counter = Counter(
     name="unique_searches",
     documentation="Unique stream search counter",
@@ -53,7 +58,8 @@ async def _search(
     )
     log.info("searching for stream links")
 
-    stream_links: list[StreamLink] = await get_stream_links(
+    stream_links: list[tuple[StreamLink, TorrentMeta]]
+    stream_links, partial = await get_stream_links(
         debrid=debrid,
         imdb=imdb_id,
         max_results=max_results,
@@ -63,17 +69,17 @@ async def _search(
     )
 
     log.info("got stream links", count=len(stream_links))
-    sorted_links: list[StreamLink] = list(
-        sorted(
-            chain(stream_links),
-            key=lambda x: (human.rank_quality(x.name), float(x.size)),
-            reverse=True,
-        )
+    sorted_links: list[tuple[StreamLink, TorrentMeta]] = heapq.nlargest(
+        max_results,
+        stream_links,
+        key=lambda x: (human.rank_quality(x[0].name), float(x[0].size)),
     )
 
-    streams: list[Stream] = [map_stream_link(link=link, debrid=debrid) for link in sorted_links]
+    streams: list[Stream] = [
+        map_stream_link(link=link, meta=meta, debrid=debrid) for link, meta in sorted_links
+    ]
 
-    return StreamResponse(streams=streams)
+    return StreamResponse(streams=streams, partial=partial)
 
 
 async def wait_for_results(
@@ -127,7 +133,13 @@ async def get_stream_links(
     filters: list[Filter],
     season: int = 0,
     episode: int = 0,
-) -> list[StreamLink]:
+) -> tuple[list[tuple[StreamLink, TorrentMeta]], bool]:
+    """
+    Returns the stream links found by the debrid service along with the
+    metadata parsed from their names so callers do not have to parse them
+    again, and whether the search timed out before the debrid service was
+    done.
+    """
     log.debug("getting stream links", imdb=imdb, max_results=max_results, filters=filters)
 
     torrent_resolution_done = asyncio.Event()
@@ -157,45 +169,119 @@ async def get_stream_links(
     else:
         torrent_resolution_done.set()
 
-    resolution_links: dict[str, list[StreamLink]] = defaultdict(list)
+    resolution_links: dict[str, list[tuple[StreamLink, TorrentMeta]]] = defaultdict(list)
+    max_per_resolution: int = math.ceil(max_results / 3)
     total_links: int = 0
     total_processed: int = 0
     stop = asyncio.Event()
+    q = asyncio.Queue[StreamLink | Exception | None](maxsize=max_results * 2)
+    producer = asyncio.create_task(
+        produce_stream_links(
+            q=q,
+            debrid=debrid,
+            torrents=torrents,
+            season=season,
+            episode=episode,
+            stop=stop,
+            max_results=max_results,
+        )
+    )
 
-    async for link in debrid.get_stream_links(
-        torrents=torrents,
-        season=season,
-        episode=episode,
-        stop=stop,
-        max_results=max_results,
-    ):
-        total_processed += 1
-        resolution: str = ""
-        try:
-            resolution: str = next(iter(TorrentMeta.parse_title(link.name).resolution), "NONE")
-        except ValidationError as e:
-            log.debug("error parsing title", title=link.name, exc_info=e)
-            continue
-
-        if len(resolution_links[resolution]) >= math.ceil(max_results / 3):
-            log.debug("max results for resolution", resolution=resolution)
-            continue
-
-        resolution_links[resolution].append(link)
-        total_links += 1
-        if total_links >= max_results:
-            log.debug("max results total")
-            stop.set()
-            break
+    partial = False
+    # raised only after the deadline's scope so a provider's own TimeoutError
+    # isn't mistaken for the search running out of time
+    error: Exception | None = None
+    try:
+        async with asyncio.timeout(SEARCH_TIMEOUT):
+            while (link := await q.get()) is not None:
+                if isinstance(link, Exception):
+                    error = link
+                    break
+                total_processed += 1
+                if not add_stream_link(link, resolution_links, max_per_resolution):
+                    continue
+                total_links += 1
+                if total_links >= max_results:
+                    log.debug("max results total")
+                    break
+    except TimeoutError:
+        log.info("timed out waiting for stream links", processed=total_processed)
+        partial = True
+    finally:
+        # cancelling the producer closes the debrid generator which in turn
+        # cancels whatever lookups it still has in flight
+        stop.set()
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+    if error is not None:
+        raise error
 
     await torrent_resolution_done.wait()
 
-    return list(chain.from_iterable(resolution_links.values()))
+    return list(chain.from_iterable(resolution_links.values())), partial
+
+
+def add_stream_link(
+    link: StreamLink,
+    resolution_links: dict[str, list[tuple[StreamLink, TorrentMeta]]],
+    max_per_resolution: int,
+) -> bool:
+    """
+    Adds the link to the bucket for its resolution unless the title can't be
+    parsed or the bucket is already full. Returns whether it was added.
+    """
+    try:
+        meta: TorrentMeta = TorrentMeta.parse_title(link.name)
+    except ValidationError as e:
+        log.debug("error parsing title", title=link.name, exc_info=e)
+        return False
+    resolution: str = next(iter(meta.resolution), "NONE")
 
+    links = resolution_links[resolution]
+    if len(links) >= max_per_resolution:
+        log.debug("max results for resolution", resolution=resolution)
+        return False
 
-def map_stream_link(link: StreamLink, debrid: DebridService) -> Stream:
-    meta: TorrentMeta = TorrentMeta.parse_title(link.name)
+    links.append((link, meta))
+    return True
 
+
+async def produce_stream_links(
+    q: asyncio.Queue[StreamLink | Exception | None],
+    debrid: DebridService,
+    torrents: list[str],
+    stop: asyncio.Event,
+    max_results: int,
+    season: int = 0,
+    episode: int = 0,
+) -> None:
+    """
+    Feeds the stream links from the debrid service into the queue followed by
+    None once there are no more, or by the exception if the debrid service
+    failed. The bounded queue keeps the debrid service from running too far
+    ahead of the consumer.
+    """
+    try:
+        async with contextlib.aclosing(
+            debrid.get_stream_links(
+                torrents=torrents,
+                season=season,
+                episode=episode,
+                stop=stop,
+                max_results=max_results,
+            )
+        ) as links:
+            async for link in links:
+                await q.put(link)
+    except Exception as e:
+        await q.put(e)
+        return
+    await q.put(None)
+
+
+def map_stream_link(link: StreamLink, meta: TorrentMeta, debrid: DebridService) -> Stream:
     meta_parts: list[str] = []
     if resolution := next(iter(meta.resolution), None):
         meta_parts.append(f"📺{resolution}")
@@ -234,6 +320,15 @@ REQUEST_DURATION = Histogram(
 )
 
 
+@lru_cache(maxsize=64)
+def _request_duration(type: str, debrid_service: str) -> Histogram:
+    """
+    Bound histogram child for a label set so every request doesn't pay for
+    resolving the labels again.
+    """
+    return REQUEST_DURATION.labels(type=type, debrid_service=debrid_service)
+
+
 async def get_hashes(
     imdb_id: str,
     limit: int = 20,
@@ -248,6 +343,32 @@ async def get_hashes(
     )
 
 
+# Identical searches from different clients tend to arrive within seconds of
+# each other so responses are kept in memory for a short while. Concurrent
+# misses share the task of the first search instead of repeating it.
+_search_cache: dict[tuple[Any, ...], tuple[float, StreamResponse]] = {}
+_search_tasks: dict[tuple[Any, ...], asyncio.Task[StreamResponse]] = {}
+
+
+def _get_cached_search(key: tuple[Any, ...]) -> StreamResponse | None:
+    cached = _search_cache.get(key)
+    if cached is None:
+        return None
+    expires, res = cached
+    if expires < time.monotonic():
+        _search_cache.pop(key, None)
+        return None
+    # callers rewrite the stream urls so they each need their own copy
+    return res.model_copy(deep=True)
+
+
+def _set_cached_search(key: tuple[Any, ...], res: StreamResponse) -> None:
+    now = time.monotonic()
+    for k in [k for k, (expires, _) in _search_cache.items() if expires < now]:
+        del _search_cache[k]
+    _search_cache[key] = (now + SEARCH_CACHE_SECONDS, res.model_copy(deep=True))
+
+
 async def search(
     type: str,
     max_results: int,
@@ -268,19 +389,68 @@ async def search(
         season_episode=season_episode,
         filters=filters,
     )
-    with REQUEST_DURATION.labels(
-        type=type,
-        debrid_service=debrid.id(),
-    ).time():
-        try:
-            return await _search(
-                type=type,
-                max_results=max_results,
-                debrid=debrid,
-                imdb_id=imdb_id,
-                season_episode=season_episode,
-                filters=filters,
+    key: tuple[Any, ...] = (
+        type,
+        imdb_id,
+        tuple(season_episode),
+        debrid.id(),
+        debrid.api_key,
+        max_results,
+        tuple(sorted(f.id for f in filters)),
+    )
+    with _request_duration(type, debrid.id()).time():
+        if cached := _get_cached_search(key):
+            log.debug("returning cached search", type=type, id=imdb_id)
+            return cached
+
+        task = _search_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                _search_and_cache(
+                    key=key,
+                    type=type,
+                    max_results=max_results,
+                    debrid=debrid,
+                    imdb_id=imdb_id,
+                    season_episode=season_episode,
+                    filters=filters,
+                )
             )
-        except Exception as e:
-            log.error("error searching", type=type, id=imdb_id, exc_info=e)
-            return StreamResponse(streams=[], error="Error searching")
+            _search_tasks[key] = task
+            task.add_done_callback(lambda t: _forget_search_task(key, t))
+        # shielded so one client going away doesn't cancel the search for
+        # everyone else waiting on it
+        res: StreamResponse = await asyncio.shield(task)
+        return res.model_copy(deep=True)
+
+
+async def _search_and_cache(
+    key: tuple[Any, ...],
+    type: str,
+    max_results: int,
+    debrid: DebridService,
+    imdb_id: str,
+    season_episode: list[int],
+    filters: list[Filter],
+) -> StreamResponse:
+    try:
+        res: StreamResponse = await _search(
+            type=type,
+            max_results=max_results,
+            debrid=debrid,
+            imdb_id=imdb_id,
+            season_episode=season_episode,
+            filters=filters,
+        )
+    except Exception as e:
+        log.error("error searching", type=type, id=imdb_id, exc_info=e)
+        return StreamResponse(streams=[], error="Error searching")
+
+    if res.streams and not res.error and not res.partial:
+        _set_cached_search(key, res)
+    return res
+
+
+def _forget_search_task(key: tuple[Any, ...], task: asyncio.Task[StreamResponse]) -> None:
+    if _search_tasks.get(key) is task:
+        del _search_tasks[key]
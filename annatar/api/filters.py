@@ -117,8 +117,11 @@ ALL = (
 )
 
 
+_BY_ID: dict[str, Filter] = {f.id: f for f in ALL}
+
+
 def by_id(id: str) -> Filter:
-    return next(filter(lambda f: f.id == id, ALL))
+    return _BY_ID[id]
 
 
 def by_category(category: str) -> list[Filter]:
@@ -1,5 +1,7 @@
+import asyncio
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional
 
 import aiohttp
@@ -11,6 +13,13 @@ from annatar.instrumentation import HTTP_CLIENT_REQUEST_DURATION
 
 log = structlog.get_logger(__name__)
 
+_YEAR_RE = re.compile(r"\d+\Z")
+
+# the lookup lock has to outlive the request, otherwise a slow response lets
+# the waiting processors through to make the same request
+REQUEST_TIMEOUT_SECONDS = 8
+LOCK_TIMEOUT = timedelta(seconds=REQUEST_TIMEOUT_SECONDS + 2)
+
 
 class MediaInfo(BaseModel):
     id: str
@@ -42,12 +51,10 @@ class MediaInfo(BaseModel):
             return None
 
         # you'd think to split on - but you'd be wrong because cinemeta uses
-        # an en-dash instead of a hyphen. Splitting on \D works for both cases
-        if match := re.split(r"\D", self.releaseInfo):
-            try:
-                return int(match.pop())
-            except ValueError:
-                return None
+        # an en-dash instead of a hyphen. Matching the trailing digits works
+        # for both cases and gives None for open ended ranges like "2000-"
+        if match := _YEAR_RE.search(self.releaseInfo):
+            return int(match.group())
         return None
 
 
@@ -55,9 +62,14 @@ async def _get_media_info(id: str, type: str) -> MediaInfo | None:
     api_url = f"https://v3-cinemeta.strem.io/meta/{type}/{id}.json"
     status = ""
     error = False
-    start_time = datetime.now()
+    start_time = time.monotonic()
     try:
-        async with aiohttp.ClientSession() as session, session.get(api_url) as response:
+        async with (
+            aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            ) as session,
+            session.get(api_url) as response,
+        ):
             status = f"{response.status // 100}xx"
             if response.status not in range(200, 300):
                 log.error(
@@ -79,6 +91,10 @@ async def _get_media_info(id: str, type: str) -> MediaInfo | None:
                 return None
 
             return MediaInfo(**meta)
+    except asyncio.TimeoutError:
+        log.error("timed out retrieving MediaInfo from strem.io", api_url=api_url)
+        error = True
+        return None
     finally:
         HTTP_CLIENT_REQUEST_DURATION.labels(
             client="cinemeta",
@@ -86,7 +102,7 @@ async def _get_media_info(id: str, type: str) -> MediaInfo | None:
             url="/meta/{type}/{id}.json",
             status_code=status,
             error=error,
-        ).observe(amount=(datetime.now() - start_time).total_seconds())
+        ).observe(amount=time.monotonic() - start_time)
 
 
 async def get_media_info(id: str, type: str) -> Optional[MediaInfo]:
@@ -96,13 +112,21 @@ async def get_media_info(id: str, type: str) -> Optional[MediaInfo]:
     if cached_result:
         return cached_result
 
-    res: Optional[MediaInfo] = await _get_media_info(id=id, type=type)
-    if res is None:
-        return None
+    # every search processor looks up the same media at the same time so on a
+    # cold cache only the first one goes to cinemeta and the rest wait for it.
+    # Waiters poll slowly because each attempt is a blocking redis call.
+    async with await db.lock(f"lock:{cache_key}", timeout=LOCK_TIMEOUT, delay=0.25):
+        cached_result = await db.get_model(cache_key, model=MediaInfo)
+        if cached_result:
+            return cached_result
+
+        res: Optional[MediaInfo] = await _get_media_info(id=id, type=type)
+        if res is None:
+            return None
 
-    await db.set(
-        cache_key,
-        res.model_dump_json(),
-        ttl=timedelta(days=30),
-    )
-    return res
+        await db.set(
+            cache_key,
+            res.model_dump_json(),
+            ttl=timedelta(days=30),
+        )
+        return res
@@ -2,7 +2,8 @@ import asyncio
 import contextlib
 import os
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Any, Type, TypeVar
 
 import aiohttp
@@ -56,7 +57,7 @@ async def search_imdb(
         "Tracker[]": ",".join(indexers),
     }
     log.debug("searching jackett", indexers=indexers, imdb=imdb)
-    start_time = datetime.now()
+    start_time = time.monotonic()
     error = None
     try:
         return (
@@ -76,7 +77,7 @@ async def search_imdb(
         REQUEST_DURATION.labels(
             method="indexer_search", indexer=",".join(indexers), error=error
         ).observe(
-            amount=(datetime.now() - start_time).total_seconds(),
+            amount=time.monotonic() - start_time,
         )
 
 
@@ -98,7 +99,7 @@ async def search(
     }
 
     log.debug("searching jackett", indexers=",".join(indexers), query=query)
-    start_time = datetime.now()
+    start_time = time.monotonic()
     error = None
     try:
         return (
@@ -118,7 +119,7 @@ async def search(
         REQUEST_DURATION.labels(
             method="indexer_search", indexer=",".join(indexers), error=error
         ).observe(
-            amount=(datetime.now() - start_time).total_seconds(),
+            amount=time.monotonic() - start_time,
         )
 
 
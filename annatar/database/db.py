@@ -67,9 +67,9 @@ async def get_model(key: str, model: Type[TBaseModel]) -> Optional[TBaseModel]:
         return None
 
 
-@REQUEST_DURATION.labels("KEYS").time()
+@REQUEST_DURATION.labels("SCAN").time()
 async def list_keys(pattern: str) -> list[str]:
-    return [key.decode("utf-8") for key in redis.keys(pattern)]
+    return [key.decode("utf-8") for key in redis.scan_iter(match=pattern)]
 
 
 @REQUEST_DURATION.labels("ZADD").time()
@@ -139,7 +139,6 @@ async def _unique_list_get_scored(
     limit_per_score: int = sys.maxsize,
 ) -> list[ScoredItem]:
     try:
-        results: dict[int, list[ScoredItem]] = defaultdict(list)
         redis_items = redis.zrange(
             name=name,
             start=max_score,
@@ -150,17 +149,63 @@ async def _unique_list_get_scored(
             num=limit,
             offset=0,
         )
-        for i in redis_items:
-            score = int(i[1])
-            if len(results[score]) < limit_per_score:
-                results[score].append(ScoredItem(score=score, value=i[0].decode("utf-8")))
+        results = _scored_items(redis_items, limit_per_score)
         log.debug("returned items from unique list", count=len(results), name=name)
-        return [item for sublist in results.values() for item in sublist]
+        return results
     except Exception as e:
         log.error("failed to get unique list", name=name, exc_info=e)
         return []
 
 
+@REQUEST_DURATION.labels("ZRANGE").time()
+async def unique_lists_get_scored(
+    names: list[str],
+    min_score: int = 0,
+    max_score: int = sys.maxsize,
+    limit: int = sys.maxsize,
+    limit_per_score: int = sys.maxsize,
+) -> list[list[ScoredItem]]:
+    """
+    Same as unique_list_get_scored for several lists but pipelined into a
+    single round trip. Results are returned in the same order as names.
+    """
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for name in names:
+            pipe.zrange(
+                name=name,
+                start=max_score,
+                end=min_score,
+                desc=True,
+                withscores=True,
+                byscore=True,
+                num=limit,
+                offset=0,
+            )
+        responses = pipe.execute()
+    except Exception as e:
+        log.error("failed to get unique lists", names=names, exc_info=e)
+        return [[] for _ in names]
+
+    results: list[list[ScoredItem]] = []
+    for name, redis_items in zip(names, responses, strict=True):
+        items = _scored_items(redis_items, limit_per_score)
+        label: str = "hit" if items else "miss"
+        CACHE_REQUEST.labels(result=label).inc()
+        log.debug(f"cache {label}", key=name, count=len(items))
+        results.append(items)
+    return results
+
+
+def _scored_items(redis_items: list[Any], limit_per_score: int) -> list[ScoredItem]:
+    results: dict[int, list[ScoredItem]] = defaultdict(list)
+    for i in redis_items:
+        score = int(i[1])
+        if len(results[score]) < limit_per_score:
+            results[score].append(ScoredItem(score=score, value=i[0].decode("utf-8")))
+    return [item for sublist in results.values() for item in sublist]
+
+
 async def set_model(key: str, model: BaseModel, ttl: timedelta) -> bool:
     return await set(
         key,
@@ -214,6 +259,15 @@ async def set(key: str, value: str, ttl: timedelta | None = None) -> bool:
         return False
 
 
+@REQUEST_DURATION.labels("DEL").time()
+async def delete(key: str) -> bool:
+    try:
+        return bool(redis.delete(key))
+    except Exception as e:
+        log.error("failed to delete cache", key=key, exc_info=e)
+        return False
+
+
 @REQUEST_DURATION.labels("HSET").time()
 async def hset(key: str, field: str, value: str) -> bool:
     return await measure_hits(key, lambda: _hset(key, field, value))
@@ -296,8 +350,8 @@ async def unlock(key: str) -> bool:
     return bool(redis.delete(key))
 
 
-async def lock(key: str) -> AsyncLockManager:
-    return AsyncLockManager(redis, key)
+async def lock(key: str, timeout: timedelta | int = 10, delay: float = 0.05) -> AsyncLockManager:
+    return AsyncLockManager(redis, key, timeout=timeout, delay=delay)
 
 
 if REDIS_URL:
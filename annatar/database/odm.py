@@ -81,11 +81,11 @@ async def list_torrents(
 ) -> list[str]:
     if filters is None:
         filters = []
-    keys = set([Keys.torrents(imdb, season, episode), Keys.torrents(imdb, season)])
+    keys = list(set([Keys.torrents(imdb, season, episode), Keys.torrents(imdb, season)]))
     log.debug("looking up torrents", keys=keys, limit=limit)
     results: list[db.ScoredItem] = []
-    for key in keys:
-        for item in await db.unique_list_get_scored(name=key):
+    for items in await db.unique_lists_get_scored(names=keys):
+        for item in items:
             if filters:
                 title = await get_torrent_title(item.value)
                 if not title:
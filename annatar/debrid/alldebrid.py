@@ -1,12 +1,17 @@
 import asyncio
 import urllib.parse
+from datetime import timedelta
+from functools import cached_property
+from hashlib import blake2b
 from typing import Any, AsyncGenerator
 
 import aiohttp
+import orjson
 import structlog
 from pydantic import BaseModel
 
 from annatar import human
+from annatar.database import db
 from annatar.debrid.alldebrid_models import (
     AddTorrentResponse,
     CachedFile,
@@ -21,12 +26,20 @@ from annatar.torrent import TorrentMeta
 
 log = structlog.get_logger(__name__)
 
+INSTANT_CACHE_TTL = timedelta(seconds=60)
+STATUS_CACHE_TTL = timedelta(seconds=30)
+
 
 class HttpResponse(BaseModel):
     status: int
     headers: list[tuple[str, str]]
-    response_json: dict[str, Any] | None = None
-    response_text: str | None = None
+    response_text: str = ""
+
+    @cached_property
+    def response_json(self) -> dict[str, Any] | None:
+        # only decoded when asked for. Responses that map onto a model are
+        # validated straight from response_text instead
+        return orjson.loads(self.response_text) if self.response_text else None
 
 
 class AllDebridProvider(DebridService):
@@ -44,7 +57,7 @@ class AllDebridProvider(DebridService):
         query["agent"] = "https://gitlab.com/stremio-add-ons/annatar"
         log.debug("making request", method=method, url=url, query=query, body=body, form=form)
         query["apikey"] = self.api_key
-        async with aiohttp.ClientSession() as session, session.request(
+        async with self.http_session().request(
             method,
             f"{self.BASE_URL}{url}",
             params=query,
@@ -55,11 +68,25 @@ class AllDebridProvider(DebridService):
             return HttpResponse(
                 status=response.status,
                 headers=list(response.headers.items()),
-                response_json=await response.json(),
                 response_text=await response.text(),
             )
 
+    def status_cache_key(self) -> str:
+        return f"alldebrid:status:{blake2b(self.api_key.encode(), digest_size=16).hexdigest()}"
+
     async def get_cached_torrents(self, info_hashes: list[str]) -> list[CachedMagnet]:
+        # whether a magnet is instantly available is the same for every
+        # account so the api key is left out of the key and the result is
+        # shared between users. The magnet status listing is per account and
+        # is keyed by the api key instead, see status_cache_key.
+        # The hashes are kept in order because the results are yielded in
+        # the same order that the torrents were ranked.
+        hashes_digest = blake2b(",".join(info_hashes).encode(), digest_size=16).hexdigest()
+        cache_key = f"alldebrid:instant:{hashes_digest}"
+        if cached := await db.get(cache_key):
+            resp = CachedResponse.model_validate_json(cached)
+            return [m for m in resp.magnets if m.instant]
+
         form = aiohttp.FormData(quote_fields=False)
         for info_hash in info_hashes:
             form.add_field("magnets[]", info_hash)
@@ -70,10 +97,12 @@ class AllDebridProvider(DebridService):
             url="/magnet/instant",
             form=form,
         )
-        if response is None:
+        if response is None or not response.response_text:
             log.info("no response from alldebrid")
             return []
-        resp = CachedResponse.model_validate(response.response_json)
+        resp = CachedResponse.model_validate_json(response.response_text)
+        if resp.status == "success":
+            await db.set(cache_key, response.response_text, ttl=INSTANT_CACHE_TTL)
         if not resp:
             log.info("no cached torrents", response=response)
             return []
@@ -84,10 +113,8 @@ class AllDebridProvider(DebridService):
 
     async def get_or_add_torrent(self, info_hash: str) -> TorrentInfo | None:
         torrent_infos: MagnetStatusResponse | None = await self.get_torrent_info()
-        if torrent_infos and torrent_infos.magnets:
-            for torrent in torrent_infos.magnets:
-                if torrent.hash.casefold() == info_hash.casefold():
-                    return torrent
+        if torrent_infos and (torrent := torrent_infos.find(info_hash)):
+            return torrent
 
         log.debug("torrent not found, adding", info_hash=info_hash)
         torrent_added = await self.add_torrent(info_hash)
@@ -97,9 +124,7 @@ class AllDebridProvider(DebridService):
             if not torrent_infos:
                 log.debug("failed to get torrent info", info_hash=info_hash)
                 return None
-            for torrent in torrent_infos.magnets:
-                if torrent.hash.casefold() == info_hash.casefold():
-                    return torrent
+            return torrent_infos.find(info_hash)
         return None
 
     async def get_stream_for_torrent(
@@ -136,19 +161,29 @@ class AllDebridProvider(DebridService):
         return UnlockLink.model_validate(response.response_json.get("data", {}))
 
     async def get_torrent_info(self, torrent_id: int | None = None) -> MagnetStatusResponse | None:
+        # the status of every magnet is only cached when listing them all
+        if not torrent_id and (cached := await db.get(self.status_cache_key())):
+            return MagnetStatusResponse.model_validate_json(cached)
+
         q = {"id": torrent_id} if torrent_id else None
         response = await self.make_request("GET", "/magnet/status", query=q)
-        if response is None:
+        if response is None or not response.response_text:
             return None
-        return MagnetStatusResponse.model_validate(response.response_json)
+        status = MagnetStatusResponse.model_validate_json(response.response_text)
+        if not torrent_id and status.status == "success":
+            await db.set(self.status_cache_key(), response.response_text, ttl=STATUS_CACHE_TTL)
+        return status
 
     async def add_torrent(self, info_hash: str) -> AddTorrentResponse | None:
         raw_resp = await self.make_request(
             "POST", "/magnet/upload", form=aiohttp.FormData({"magnet[]": info_hash})
         )
-        if raw_resp is None or raw_resp.response_json is None:
+        if raw_resp is None or not raw_resp.response_text:
             return None
-        return AddTorrentResponse.model_validate(raw_resp.response_json)
+        added = AddTorrentResponse.model_validate_json(raw_resp.response_text)
+        if added.magnets:
+            await db.delete(self.status_cache_key())
+        return added
 
     # implements DebridService
     def shared_cache(self) -> bool:
@@ -212,7 +247,7 @@ def get_matched_file(files: list[CachedFile], season: int, episode: int) -> Cach
     if not by_size:
         return None
 
-    for file in by_size:
+    for file in human.prefer_season_episode(by_size, lambda f: f.name, season, episode):
         meta = TorrentMeta.parse_title(file.name)
         if meta.is_trash():
             log.debug("skipping trash file", file=file.name)
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic import BaseModel, Field, root_validator
 
 
@@ -106,6 +108,13 @@ class MagnetStatusResponse(BaseModel):
     status: str
     magnets: list[TorrentInfo]
 
+    @cached_property
+    def by_hash(self) -> dict[str, TorrentInfo]:
+        return {m.hash.casefold(): m for m in self.magnets}
+
+    def find(self, info_hash: str) -> TorrentInfo | None:
+        return self.by_hash.get(info_hash.casefold())
+
     @root_validator(pre=True)
     @classmethod
     def validate_status(cls, values):
@@ -1,9 +1,23 @@
 import asyncio
+import weakref
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator
 
+import aiohttp
+import orjson
+import structlog
+
 from annatar.debrid.models import StreamLink
 
+log = structlog.get_logger(__name__)
+
+# aiohttp sessions are bound to the event loop they were created on. The
+# torrent and search processors run their own loops in separate threads so we
+# keep one pooled session per loop rather than a single global one. Every loop
+# has to close its session with close_http_session before it shuts down; the
+# weak keys only make sure this map isn't what keeps a finished loop around.
+_sessions = weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]()
+
 
 class DebridService(ABC):
     api_key: str
@@ -15,6 +29,31 @@ class DebridService(ABC):
         self.api_key = api_key
         self.source_ip = source_ip
 
+    @staticmethod
+    def http_session() -> aiohttp.ClientSession:
+        """
+        Returns the shared HTTP session for the running event loop so
+        connections to the debrid APIs are kept alive and reused between
+        requests.
+        """
+        loop = asyncio.get_running_loop()
+        session = _sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, limit_per_host=20, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30),
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+            _sessions[loop] = session
+        return session
+
+    @staticmethod
+    async def close_http_session() -> None:
+        loop = asyncio.get_running_loop()
+        if session := _sessions.pop(loop, None):
+            log.info("closing debrid http session")
+            await session.close()
+
     @abstractmethod
     def shared_cache(self) -> bool:
         ...
@@ -1,12 +1,16 @@
 import asyncio
 import urllib.parse
+from datetime import timedelta
+from functools import cached_property
+from hashlib import blake2b
 from typing import Any, AsyncGenerator
 
-import aiohttp
+import orjson
 import structlog
 from pydantic import BaseModel
 
 from annatar import human, magnet
+from annatar.database import db
 from annatar.debrid.debrid_service import DebridService, StreamLink
 from annatar.debrid.debridlink_models import (
     CachedFile,
@@ -18,12 +22,19 @@ from annatar.torrent import TorrentMeta
 
 log = structlog.get_logger(__name__)
 
+CACHED_TORRENTS_TTL = timedelta(seconds=60)
+
 
 class HttpResponse(BaseModel):
     status: int
     headers: list[tuple[str, str]]
-    response_json: dict[str, Any] | None = None
-    response_text: str | None = None
+    response_text: str = ""
+
+    @cached_property
+    def response_json(self) -> dict[str, Any] | None:
+        # only decoded when asked for. Responses that map onto a model are
+        # validated straight from response_text instead
+        return orjson.loads(self.response_text) if self.response_text else None
 
 
 class DebridLink(DebridService):
@@ -40,30 +51,35 @@ class DebridLink(DebridService):
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        async with aiohttp.ClientSession() as session, session.request(
+        async with self.http_session().request(
             method, f"{self.BASE_URL}{url}", params=query, json=body, headers=headers
         ) as response:
             response.raise_for_status()
             return HttpResponse(
                 status=response.status,
                 headers=list(response.headers.items()),
-                response_json=await response.json(),
                 response_text=await response.text(),
             )
 
     async def get_cached_torrents(self, info_hashes: list[str]) -> dict[str, CachedMagnet] | None:
         magnet_links = [urllib.parse.quote_plus(magnet.make_magnet_link(x)) for x in info_hashes]
+        query = ",".join(magnet_links)
+        cache_key = f"debridlink:cached:{blake2b(query.encode(), digest_size=16).hexdigest()}"
+        if cached := await db.get(cache_key):
+            return CachedResponse.model_validate_json(cached).value
+
         response = await self.make_request(
             method="GET",
             url="/seedbox/cached",
-            query={"url": ",".join(magnet_links)},
+            query={"url": query},
         )
-        if response is None:
+        if response is None or not response.response_text:
             return None
-        resp = CachedResponse.model_validate(response.response_json)
+        resp = CachedResponse.model_validate_json(response.response_text)
         if not resp.success:
             log.info("failed to get cached torrents", response=resp)
             return None
+        await db.set(cache_key, response.response_text, ttl=CACHED_TORRENTS_TTL)
         return resp.value
 
     async def get_stream_for_torrent(
@@ -168,7 +184,7 @@ def get_matched_file(files: list[CachedFile], season: int, episode: int) -> Cach
     if not by_size:
         return None
 
-    for file in by_size:
+    for file in human.prefer_season_episode(by_size, lambda f: f.name, season, episode):
         meta = TorrentMeta.parse_title(file.name)
         if meta.is_trash():
             log.debug("skipping trash file", file=file.name)
@@ -26,7 +26,7 @@ async def select_stream_file(
         if human.is_video(f.path, f.size):
             return StreamLink(name=f.path.split("/")[-1], size=f.size, url=f.link)
 
-    for file in sorted_files:
+    for file in human.prefer_season_episode(sorted_files, lambda f: f.path, season, episode):
         if not human.is_video(file.path, file.size):
             log.debug("file is not a video", file=file.path)
             continue
@@ -76,29 +76,31 @@ async def get_stream_links(
     episode: int = 0,
 ) -> AsyncGenerator[StreamLink, None]:
     """
-    Generates a list of stream links for each torrent link.
+    Generates a list of stream links for each torrent link. Up to max_results * 3
+    torrents are looked up concurrently and any lookups still in flight are
+    cancelled once stop is set.
     """
-    concurrency = max_results * 3
-    grouped = [torrents[i : i + concurrency] for i in range(0, len(torrents), concurrency)]
-
-    for group in grouped:
-        if stop.is_set():
-            return
-        tasks = [
-            asyncio.create_task(
-                get_stream_link(
-                    info_hash=info_hash,
-                    season=season,
-                    episode=episode,
-                    debrid_token=debrid_token,
-                )
+    sem = asyncio.Semaphore(max_results * 3)
+
+    async def _get_stream_link(info_hash: str) -> StreamLink | None:
+        async with sem:
+            return await get_stream_link(
+                info_hash=info_hash,
+                season=season,
+                episode=episode,
+                debrid_token=debrid_token,
             )
-            for info_hash in group
-        ]
 
+    tasks = [asyncio.create_task(_get_stream_link(info_hash)) for info_hash in torrents]
+    try:
         for task in asyncio.as_completed(tasks):
             link = await task
             if link:
                 yield link
             if stop.is_set():
                 return
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
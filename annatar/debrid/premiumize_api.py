@@ -1,5 +1,6 @@
-from datetime import datetime, timedelta
-from typing import Any, Generic, Optional, Type, TypeVar
+import time
+from datetime import timedelta
+from typing import Generic, Optional, Type, TypeVar
 
 import aiohttp
 import structlog
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 
 from annatar import magnet
 from annatar.database import db
+from annatar.debrid.debrid_service import DebridService
 from annatar.debrid.pm_models import DirectDLResponse
 from annatar.instrumentation import HTTP_CLIENT_REQUEST_DURATION
 
@@ -41,23 +43,21 @@ async def make_request(
     if params is None:
         params = {}
     status_code: int = 0
-    start_time = datetime.now()
+    start_time = time.monotonic()
     error = True
     try:
-        async with aiohttp.ClientSession() as session:
-            params["apikey"] = api_token
-            async with session.request(
-                method=method,
-                url=f"{ROOT_URL}{url}",
-                params=params,
-                data=data,
-                headers=headers,
-            ) as response:
-                status_code = response.status if response.status else 0
-                raw: dict[str, Any] = await response.json()
-                model_instance = model.model_validate(raw)
-                error = False
-                return HTTPResponse(model=model_instance, response=response)
+        params["apikey"] = api_token
+        async with DebridService.http_session().request(
+            method=method,
+            url=f"{ROOT_URL}{url}",
+            params=params,
+            data=data,
+            headers=headers,
+        ) as response:
+            status_code = response.status if response.status else 0
+            model_instance = model.model_validate_json(await response.read())
+            error = False
+            return HTTPResponse(model=model_instance, response=response)
     finally:
         HTTP_CLIENT_REQUEST_DURATION.labels(
             client="premiumize.me",
@@ -65,7 +65,7 @@ async def make_request(
             url=url,
             status_code=f"{status_code // 100}xx",
             error=error,
-        ).observe(amount=(datetime.now() - start_time).total_seconds())
+        ).observe(amount=time.monotonic() - start_time)
 
 
 async def directdl(
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 from typing import AsyncGenerator
 
 from annatar.debrid import pm
@@ -30,12 +31,15 @@ class PremiumizeProvider(DebridService):
         season: int = 0,
         episode: int = 0,
     ) -> AsyncGenerator[StreamLink, None]:
-        async for sl in pm.get_stream_links(
-            torrents=torrents,
-            debrid_token=self.api_key,
-            season=season,
-            episode=episode,
-            stop=stop,
-            max_results=max_results,
-        ):
-            yield sl
+        async with contextlib.aclosing(
+            pm.get_stream_links(
+                torrents=torrents,
+                debrid_token=self.api_key,
+                season=season,
+                episode=episode,
+                stop=stop,
+                max_results=max_results,
+            )
+        ) as links:
+            async for sl in links:
+                yield sl
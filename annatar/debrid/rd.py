@@ -1,6 +1,6 @@
 import asyncio
 from datetime import timedelta
-from hashlib import sha256
+from hashlib import blake2b
 from typing import AsyncGenerator, Optional
 from urllib.parse import quote_plus
 
@@ -19,6 +19,7 @@ from annatar.debrid.rd_models import (
 )
 
 ROOT_URL = "https://api.real-debrid.com/rest/1.0"
+INSTANT_AVAILABILITY_CONCURRENCY = 4
 
 
 log = structlog.get_logger(__name__)
@@ -187,7 +188,7 @@ async def get_stream_for_torrent(
     """
     Get the stream link for a torrent and file.
     """
-    key_hash: str = sha256(debrid_token.encode()).hexdigest()
+    key_hash: str = blake2b(debrid_token.encode(), digest_size=16).hexdigest()
     cache_key: str = f"rd:torrent:{info_hash}:{key_hash}:{file_id}"
     cached_stream: Optional[StreamLink] = await db.get_model(cache_key, model=StreamLink)
     if cached_stream:
@@ -215,15 +216,13 @@ async def get_stream_for_torrent(
 
 async def get_stream_link(
     info_hash: str,
+    cached_file_sets: list[list[InstantFile]],
     debrid_token: str,
     season: int = 0,
     episode: int = 0,
 ) -> StreamLink | None:
     info_hash = info_hash.upper()
-    async for cached_files in api.get_instant_availability(
-        info_hash,
-        debrid_token,
-    ):
+    for cached_files in cached_file_sets:
         if not cached_files:
             continue
 
@@ -283,29 +282,40 @@ async def get_stream_links(
     episode: int = 0,
 ) -> AsyncGenerator[StreamLink, None]:
     """
-    Generates a list of RD links for each torrent link.
+    Generates a list of RD links for each torrent link. The instant
+    availability is looked up for batches of max_results * 3 torrents at a
+    time and any lookups still in flight are cancelled once stop is set.
     """
-    concurrency = max_results * 3
-    grouped = [torrents[i : i + concurrency] for i in range(0, len(torrents), concurrency)]
-
-    for group in grouped:
-        if stop.is_set():
-            return
-        tasks = [
-            asyncio.create_task(
-                get_stream_link(
+    batch_size = max_results * 3
+    batches = [torrents[i : i + batch_size] for i in range(0, len(torrents), batch_size)]
+    sem = asyncio.Semaphore(INSTANT_AVAILABILITY_CONCURRENCY)
+
+    async def _get_stream_links(batch: list[str]) -> list[StreamLink]:
+        async with sem:
+            availability = await api.get_instant_availability(batch, debrid_token)
+        links: list[StreamLink] = []
+        for info_hash in batch:
+            if cached_file_sets := availability.get(info_hash.upper()):
+                link = await get_stream_link(
                     info_hash=info_hash,
+                    cached_file_sets=cached_file_sets,
                     season=season,
                     episode=episode,
                     debrid_token=debrid_token,
                 )
-            )
-            for info_hash in group
-        ]
+                if link:
+                    links.append(link)
+        return links
 
+    tasks = [asyncio.create_task(_get_stream_links(batch)) for batch in batches]
+    try:
         for task in asyncio.as_completed(tasks):
-            link = await task
-            if link:
+            for link in await task:
                 yield link
-            if stop.is_set():
-                return
+                if stop.is_set():
+                    return
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,10 +1,11 @@
-from datetime import datetime
-from typing import Any, AsyncGenerator
+import time
+from typing import Any
 
-import aiohttp
+import orjson
 import structlog
 
 from annatar import instrumentation, magnet
+from annatar.debrid.debrid_service import DebridService
 from annatar.debrid.rd_models import InstantFile, TorrentInfo, UnrestrictedLink
 
 ROOT_URL = "https://api.real-debrid.com/rest/1.0"
@@ -29,12 +30,12 @@ async def make_request(
         # set the origin IP for the user. RD asks for this for tracking purposes
         body["ip"] = source_ip
     api_url = f"{ROOT_URL}{url.format(**url_values)}"
-    start_time = datetime.now()
+    start_time = time.monotonic()
     status_code: str = "2xx"
     error = False
     try:
         api_headers = {"Authorization": f"Bearer {debrid_token}"}
-        async with aiohttp.ClientSession() as session, session.request(
+        async with DebridService.http_session().request(
             method, api_url, headers=api_headers, data=body
         ) as response:
             status_code = f"{response.status//100}xx"
@@ -57,7 +58,7 @@ async def make_request(
                     body=await response.text(),
                 )
                 return None
-            return await response.json()
+            return await response.json(loads=orjson.loads)
     finally:
         instrumentation.HTTP_CLIENT_REQUEST_DURATION.labels(
             client="real_debrid",
@@ -65,7 +66,7 @@ async def make_request(
             url=url,
             error=error,
             status_code=status_code,
-        ).observe((datetime.now() - start_time).total_seconds())
+        ).observe(time.monotonic() - start_time)
 
 
 async def add_magnet(info_hash: str, debrid_token: str, source_ip: str) -> str | None:
@@ -83,30 +84,33 @@ async def add_magnet(info_hash: str, debrid_token: str, source_ip: str) -> str |
 
 
 async def get_instant_availability(
-    info_hash: str,
+    info_hashes: list[str],
     debrid_token: str,
-) -> AsyncGenerator[list[InstantFile], None]:
+) -> dict[str, list[list[InstantFile]]]:
+    """
+    Looks up the instant availability of several torrents in a single request.
+    Returns the cached file sets keyed by the upper case info hash.
+    """
     res = await make_request(
         method="GET",
-        url="/torrents/instantAvailability/{info_hash}",
-        url_values={"info_hash": info_hash},
+        url="/torrents/instantAvailability/{info_hashes}",
+        url_values={"info_hashes": "/".join(info_hashes)},
         debrid_token=debrid_token,
     )
-    if res is None:
-        log.debug("No instant availability", info_hash=info_hash)
-        return
+    if not res:
+        log.debug("No instant availability", info_hashes=info_hashes)
+        return {}
 
+    availability: dict[str, list[list[InstantFile]]] = {}
     for hash, obj in res.items():
-        if hash.lower() != info_hash.lower():
-            continue
         if "rd" not in obj:
             continue
-        for set in obj.get("rd", []):
-            cached_files = [
-                InstantFile(id=int(file_id), **file_info) for file_id, file_info in set.items()
-            ]
-            log.info("found cached files", count=len(cached_files), info_hash=info_hash)
-            yield cached_files
+        availability[hash.upper()] = [
+            [InstantFile(id=int(file_id), **file_info) for file_id, file_info in set.items()]
+            for set in obj.get("rd", [])
+        ]
+        log.info("found cached files", count=len(availability[hash.upper()]), info_hash=hash)
+    return availability
 
 
 async def list_torrents(debrid_token: str, page: int = 1, limit: int = 50) -> list[TorrentInfo]:
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 from typing import AsyncGenerator, Optional
 
 from annatar.debrid import rd
@@ -30,15 +31,18 @@ class RealDebridProvider(DebridService):
         season: int = 0,
         episode: int = 0,
     ) -> AsyncGenerator[StreamLink, None]:
-        async for sl in rd.get_stream_links(
-            torrents=torrents,
-            debrid_token=self.api_key,
-            stop=stop,
-            max_results=max_results,
-            season=season,
-            episode=episode,
-        ):
-            yield sl
+        async with contextlib.aclosing(
+            rd.get_stream_links(
+                torrents=torrents,
+                debrid_token=self.api_key,
+                stop=stop,
+                max_results=max_results,
+                season=season,
+                episode=episode,
+            )
+        ) as links:
+            async for sl in links:
+                yield sl
 
     async def get_stream_for_torrent(
         self,
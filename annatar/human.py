@@ -1,9 +1,13 @@
 import re
+from functools import lru_cache
+from typing import Callable, TypeVar
 
 import structlog
 
 log = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
 PRIORITY_WORDS: list[str] = [r"\b(4K|2160p)\b", r"\b1080p\b", r"\b720p\b"]
 QUALITIES: dict[str, str] = {
     "4K": r"\b(4K|2160p)\b",
@@ -32,6 +36,7 @@ VIDEO_EXTENSIONS = [
     "webm",
     "wmv",
 ]
+_VIDEO_EXTENSIONS: frozenset[str] = frozenset(VIDEO_EXTENSIONS)
 
 
 def grep_quality(s: str) -> str:
@@ -65,7 +70,7 @@ def match_season(season: int, file: str) -> bool:
 def is_video(file: str, size: int) -> bool:
     if size < 100000000:  # 100MB
         return False
-    return file.split(".")[-1] in VIDEO_EXTENSIONS
+    return file.rsplit(".", 1)[-1].lower() in _VIDEO_EXTENSIONS
 
 
 def match_episode(episode: int, file: str) -> bool:
@@ -79,6 +84,33 @@ def find_episode(file: str) -> int | None:
     return None
 
 
+@lru_cache(maxsize=256)
+def season_episode_pattern(season: int, episode: int) -> re.Pattern[str]:
+    """
+    Pattern for the common SxxEyy notation. It is much cheaper than parsing
+    the title so it is used to find the files most likely to match first.
+    """
+    return re.compile(rf"S0?{season}\W?E0?{episode}(?!\d)", re.IGNORECASE)
+
+
+def prefer_season_episode(
+    files: list[T],
+    name_of: Callable[[T], str],
+    season: int,
+    episode: int,
+) -> list[T]:
+    """
+    Moves the files named SxxEyy for the season and episode to the front so a
+    season pack rarely needs every title parsed. The sort is stable so the
+    files otherwise keep their order. Without a season and episode the files
+    are returned as they are.
+    """
+    if not season or not episode:
+        return files
+    pattern = season_episode_pattern(season, episode)
+    return sorted(files, key=lambda f: pattern.search(name_of(f)) is None)
+
+
 def match_season_episode(season: int, episode: int, file: str) -> bool:
     matches_season = match_season(season, file)
     matches_episode = match_episode(episode, file)
@@ -92,6 +124,7 @@ def match_season_episode(season: int, episode: int, file: str) -> bool:
     return matches_season and matches_episode
 
 
+@lru_cache(maxsize=8192)
 def rank_quality(name: str) -> int:
     """
     Sort items by quality
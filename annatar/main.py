@@ -8,6 +8,7 @@ from fastapi.staticfiles import StaticFiles
 
 from annatar import instrumentation, logging, middleware, web
 from annatar.api import search, stremio
+from annatar.debrid.debrid_service import DebridService
 
 logging.init()
 instrumentation.init()
@@ -18,6 +19,7 @@ log = structlog.get_logger(__name__)
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     yield
+    await DebridService.close_http_session()
     instrumentation.shutdown()
     log.info("shutting down")
 
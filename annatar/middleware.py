@@ -1,7 +1,8 @@
 import os
+import time
 import uuid
 from contextvars import ContextVar
-from datetime import datetime
+from functools import lru_cache
 from typing import Any, Callable
 
 import structlog
@@ -25,6 +26,11 @@ REQUEST_DURATION = Histogram(
 )
 
 
+@lru_cache(maxsize=256)
+def _request_duration(method: str, handler: str, status: str) -> Histogram:
+    return REQUEST_DURATION.labels(method, handler, status)
+
+
 def get_route_handler(request: Request) -> str | None:
     for route in request.app.routes:
         match, _child_scope = route.matches(request.scope)
@@ -36,16 +42,14 @@ def get_route_handler(request: Request) -> str | None:
 
 class Metrics(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
-        start_time = datetime.now()
+        start_time = time.monotonic()
         resp: Response = await call_next(request)
-        request_time = datetime.now() - start_time
+        request_time = time.monotonic() - start_time
         status_code = f"{str(resp.status_code)[0]}xx"
         handler = get_route_handler(request)
         method = request.method
         if handler:
-            REQUEST_DURATION.labels(method, handler, status_code).observe(
-                request_time.total_seconds()
-            )
+            _request_duration(method, handler, status_code).observe(request_time)
         return resp
 
 
@@ -67,10 +71,10 @@ class RequestLogger(BaseHTTPMiddleware):
             remote=request.client.host if request.client else None,
         )
 
-        start_time: datetime = datetime.now()
+        start_time: float = time.monotonic()
         ll.info("http_request")
         response: Response = await call_next(request)
-        process_time = f"{(datetime.now() - start_time).total_seconds():.3f}s"
+        process_time = f"{time.monotonic() - start_time:.3f}s"
         response.headers["X-Process-Time"] = process_time
         response.headers["X-Request-ID"] = str(request_id.get())
 
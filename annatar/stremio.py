@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Stream(BaseModel):
@@ -10,3 +10,6 @@ class Stream(BaseModel):
 class StreamResponse(BaseModel):
     streams: list[Stream]
     error: str | None = None
+    # set when the search gave up before the debrid service was done so the
+    # response is not cached as if it were complete
+    partial: bool = Field(default=False, exclude=True)
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Generator
 
 import Levenshtein
@@ -140,9 +141,9 @@ class TorrentMeta(BaseModel):
 
     @staticmethod
     def parse_title(title: str) -> "TorrentMeta":
-        meta: dict[Any, Any] = PTN.parse(title, standardise=True, coherent_types=True)
-        meta["raw_title"] = title
-        return TorrentMeta.model_validate(meta)
+        # parsed titles are shared through the cache and scoring pops values
+        # off of the lists so every caller gets its own copy
+        return _parse_title(title).model_copy(deep=True)
 
     @property
     def audio_channels(self) -> Generator[str, None, None]:
@@ -236,6 +237,13 @@ class TorrentMeta(BaseModel):
         return result
 
 
+@lru_cache(maxsize=8192)
+def _parse_title(title: str) -> TorrentMeta:
+    meta: dict[Any, Any] = PTN.parse(title, standardise=True, coherent_types=True)
+    meta["raw_title"] = title
+    return TorrentMeta.model_validate(meta)
+
+
 class Torrent(TorrentMeta, BaseModel):
     info_hash: str
 
@@ -22,16 +22,21 @@ if WORKERS > 1:
 
 
 def start_torrent_processor(worker_id: int) -> None:
+    from annatar.debrid.debrid_service import DebridService
     from annatar.pubsub.consumers.torrent_processor import TorrentProcessor
 
     loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     _ = worker_id
-    loop.run_until_complete(TorrentProcessor.run(WORKERS))
-    loop.close()
+    try:
+        loop.run_until_complete(TorrentProcessor.run(WORKERS))
+    finally:
+        loop.run_until_complete(DebridService.close_http_session())
+        loop.close()
 
 
 def start_search_processor(indexer: str) -> None:
+    from annatar.debrid.debrid_service import DebridService
     from annatar.pubsub.consumers.torrent_search.base_jackett_processor import BaseJackettProcessor
 
     loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
@@ -43,8 +48,11 @@ def start_search_processor(indexer: str) -> None:
         queue_size=WORKERS * 5,
         categories=[Category.Movie, Category.Series],
     )
-    loop.run_until_complete(p.run())
-    loop.close()
+    try:
+        loop.run_until_complete(p.run())
+    finally:
+        loop.run_until_complete(DebridService.close_http_session())
+        loop.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+import asyncio
+import unittest
+from typing import Any, AsyncGenerator
+from unittest import mock
+
+from annatar.api.core import streams
+from annatar.debrid.models import StreamLink
+from annatar.debrid.real_debrid_provider import RealDebridProvider
+
+RESOLUTIONS = ["2160p", "1080p", "720p"]
+
+
+def stream_link(n: int) -> StreamLink:
+    resolution = RESOLUTIONS[n % len(RESOLUTIONS)]
+    return StreamLink(name=f"Movie.2020.{resolution}.{n}.mkv", size=1, url=f"http://{n}")
+
+
+class FakeProvider(RealDebridProvider):
+    """
+    Yields `count` links and then either ends, raises `error` or hangs.
+    Records how far the consumer let it get and whether it was closed.
+    """
+
+    def __init__(self, count: int, error: Exception | None = None, hang: bool = False):
+        super().__init__(api_key="key", source_ip="127.0.0.1")
+        self.count = count
+        self.error = error
+        self.hang = hang
+        self.yielded = 0
+        self.closed = False
+        self.stop: asyncio.Event | None = None
+        self.request: dict[str, Any] = {}
+
+    async def get_stream_links(
+        self,
+        torrents: list[str],
+        stop: asyncio.Event,
+        max_results: int,
+        season: int = 0,
+        episode: int = 0,
+    ) -> AsyncGenerator[StreamLink, None]:
+        self.stop = stop
+        self.request = {
+            "torrents": torrents,
+            "max_results": max_results,
+            "season": season,
+            "episode": episode,
+        }
+        try:
+            for n in range(self.count):
+                self.yielded += 1
+                yield stream_link(n)
+            if self.error:
+                raise self.error
+            if self.hang:
+                await asyncio.Event().wait()
+        finally:
+            self.closed = True
+
+
+class TestGetStreamLinks(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(streams.odm, "list_torrents", return_value=["a" * 40])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def get_stream_links(self, debrid: FakeProvider, max_results: int):
+        return await streams.get_stream_links(
+            debrid=debrid,
+            imdb="tt0111161",
+            max_results=max_results,
+            filters=[],
+        )
+
+    async def test_returns_every_link_when_the_provider_finishes(self):
+        debrid = FakeProvider(count=2)
+        links, partial = await self.get_stream_links(debrid, max_results=5)
+
+        self.assertEqual([link.url for link, _ in links], ["http://0", "http://1"])
+        self.assertEqual([meta.resolution for _, meta in links], [["4K"], ["1080p"]])
+        self.assertFalse(partial)
+        self.assertTrue(debrid.closed)
+        self.assertEqual(
+            debrid.request,
+            {"torrents": ["a" * 40], "max_results": 5, "season": 0, "episode": 0},
+        )
+
+    async def test_stops_the_provider_at_max_results(self):
+        debrid = FakeProvider(count=100)
+        links, partial = await self.get_stream_links(debrid, max_results=3)
+
+        self.assertEqual(len(links), 3)
+        self.assertFalse(partial)
+        self.assertTrue(debrid.stop and debrid.stop.is_set())
+        # the provider is closed before get_stream_links returns
+        self.assertTrue(debrid.closed)
+        # and the bounded queue kept it from running far ahead
+        self.assertLessEqual(debrid.yielded, 3 + 3 * 2 + 1)
+
+    async def test_raises_provider_errors(self):
+        debrid = FakeProvider(count=1, error=RuntimeError("boom"))
+        with self.assertRaisesRegex(RuntimeError, "boom"):
+            await self.get_stream_links(debrid, max_results=5)
+        self.assertTrue(debrid.closed)
+
+    async def test_raises_provider_timeouts_instead_of_returning_partial(self):
+        debrid = FakeProvider(count=1, error=asyncio.TimeoutError())
+        with (
+            mock.patch.object(streams, "SEARCH_TIMEOUT", 5),
+            self.assertRaises(asyncio.TimeoutError),
+        ):
+            await self.get_stream_links(debrid, max_results=5)
+
+    async def test_returns_partial_results_when_the_deadline_hits(self):
+        debrid = FakeProvider(count=1, hang=True)
+        with mock.patch.object(streams, "SEARCH_TIMEOUT", 0.1):
+            links, partial = await self.get_stream_links(debrid, max_results=5)
+
+        self.assertEqual([link.url for link, _ in links], ["http://0"])
+        self.assertTrue(partial)
+        self.assertTrue(debrid.closed)
@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+from typing import Any
+from unittest import mock
+
+from annatar.api.core import streams
+from annatar.debrid.real_debrid_provider import RealDebridProvider
+from annatar.stremio import Stream, StreamResponse
+
+
+def response(*urls: str, error: str | None = None, partial: bool = False) -> StreamResponse:
+    return StreamResponse(
+        streams=[Stream(title=url, url=url) for url in urls],
+        error=error,
+        partial=partial,
+    )
+
+
+class TestSearchCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache: dict[Any, Any] = {}
+        self.tasks: dict[Any, Any] = {}
+        for name, value in [("_search_cache", self.cache), ("_search_tasks", self.tasks)]:
+            patcher = mock.patch.object(streams, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.debrid = RealDebridProvider(api_key="key", source_ip="127.0.0.1")
+
+    async def search(self, **kwargs: Any) -> StreamResponse:
+        return await streams.search(
+            type="movie",
+            max_results=5,
+            debrid=self.debrid,
+            imdb_id="tt0111161",
+            **kwargs,
+        )
+
+    async def test_second_search_is_a_hit(self):
+        with mock.patch.object(streams, "_search", return_value=response("http://a")) as search:
+            first = await self.search()
+            second = await self.search()
+
+        search.assert_awaited_once()
+        self.assertEqual(first, second)
+
+    async def test_different_episode_is_a_miss(self):
+        with mock.patch.object(streams, "_search", return_value=response("http://a")) as search:
+            await self.search(season_episode=[1, 1])
+            await self.search(season_episode=[1, 2])
+
+        self.assertEqual(search.await_count, 2)
+
+    async def test_expired_entry_is_a_miss(self):
+        with mock.patch.object(streams, "_search", return_value=response("http://a")) as search:
+            with mock.patch.object(streams.time, "monotonic", return_value=1000.0):
+                await self.search()
+            expired = 1000.0 + streams.SEARCH_CACHE_SECONDS + 1
+            with mock.patch.object(streams.time, "monotonic", return_value=expired):
+                await self.search()
+
+        self.assertEqual(search.await_count, 2)
+
+    async def test_responses_are_copies(self):
+        with mock.patch.object(streams, "_search", return_value=response("http://a")):
+            first = await self.search()
+            first.streams[0].url = "http://rewritten"
+            second = await self.search()
+
+        self.assertEqual(second.streams[0].url, "http://a")
+
+    async def test_error_is_not_cached(self):
+        with mock.patch.object(streams, "_search", side_effect=RuntimeError("boom")) as search:
+            first = await self.search()
+            await self.search()
+
+        self.assertEqual(first.error, "Error searching")
+        self.assertEqual(search.await_count, 2)
+
+    async def test_error_response_is_not_cached(self):
+        res = response("http://a", error="debrid unavailable")
+        with mock.patch.object(streams, "_search", return_value=res) as search:
+            await self.search()
+            await self.search()
+
+        self.assertEqual(search.await_count, 2)
+
+    async def test_empty_response_is_not_cached(self):
+        with mock.patch.object(streams, "_search", return_value=response()) as search:
+            await self.search()
+            await self.search()
+
+        self.assertEqual(search.await_count, 2)
+
+    async def test_partial_response_is_not_cached(self):
+        res = response("http://a", partial=True)
+        with mock.patch.object(streams, "_search", return_value=res) as search:
+            await self.search()
+            await self.search()
+
+        self.assertEqual(search.await_count, 2)
+
+    async def test_concurrent_misses_share_one_search(self):
+        release = asyncio.Event()
+
+        async def slow_search(**_: Any) -> StreamResponse:
+            await release.wait()
+            return response()
+
+        with mock.patch.object(streams, "_search", side_effect=slow_search) as search:
+            pending = [asyncio.create_task(self.search()) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending)
+
+        search.assert_awaited_once()
+        self.assertEqual(len({id(r) for r in results}), 3)
+        self.assertEqual(self.tasks, {})
+
+    async def test_cancelled_caller_does_not_cancel_shared_search(self):
+        release = asyncio.Event()
+
+        async def slow_search(**_: Any) -> StreamResponse:
+            await release.wait()
+            return response("http://a")
+
+        with mock.patch.object(streams, "_search", side_effect=slow_search) as search:
+            first = asyncio.create_task(self.search())
+            second = asyncio.create_task(self.search())
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            res = await second
+
+        search.assert_awaited_once()
+        self.assertEqual(res.streams[0].url, "http://a")
@@ -0,0 +1,25 @@
+import unittest
+
+from annatar.clients.cinemeta import MediaInfo
+
+
+def media_info(release_info: str | None) -> MediaInfo:
+    return MediaInfo(id="tt0108778", type="series", name="Friends", releaseInfo=release_info)
+
+
+class TestReleaseYear(unittest.TestCase):
+    def test_single_year(self):
+        self.assertEqual(media_info("1994").release_year, 1994)
+
+    def test_year_range_with_en_dash(self):
+        self.assertEqual(media_info("1994–2004").release_year, 2004)
+
+    def test_year_range_with_hyphen(self):
+        self.assertEqual(media_info("1994-2004").release_year, 2004)
+
+    def test_open_ended_year_range(self):
+        self.assertIsNone(media_info("1994–").release_year)
+
+    def test_missing_year(self):
+        self.assertIsNone(media_info("").release_year)
+        self.assertIsNone(media_info(None).release_year)
@@ -0,0 +1,29 @@
+import unittest
+
+from redislite.client import StrictRedis
+
+from annatar.database import db
+
+
+class TestLock(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        db.redis = StrictRedis()
+        self.assertTrue(db.redis.ping())
+
+    async def asyncTearDown(self):
+        db.redis.flushall()
+
+    async def test_releases_lock_on_exit(self):
+        async with await db.lock("lock:test"):
+            self.assertIsNotNone(db.redis.get("lock:test"))
+        self.assertIsNone(db.redis.get("lock:test"))
+
+    async def test_does_not_release_lock_held_by_another(self):
+        async with await db.lock("lock:test"):
+            db.redis.set("lock:test", "someone else")
+        self.assertEqual(db.redis.get("lock:test"), b"someone else")
+
+    async def test_lock_expires_after_timeout(self):
+        async with await db.lock("lock:test", timeout=30):
+            self.assertLessEqual(db.redis.ttl("lock:test"), 30)
+            self.assertGreater(db.redis.ttl("lock:test"), 10)
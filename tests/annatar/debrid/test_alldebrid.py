@@ -0,0 +1,124 @@
+import re
+import unittest
+
+from aioresponses import aioresponses
+from redislite.client import StrictRedis
+
+from annatar.database import db
+from annatar.debrid.alldebrid import AllDebridProvider
+from annatar.debrid.debrid_service import DebridService
+
+INSTANT_URL = re.compile(r"^https://api\.alldebrid\.com/v4/magnet/instant")
+STATUS_URL = re.compile(r"^https://api\.alldebrid\.com/v4/magnet/status")
+UPLOAD_URL = re.compile(r"^https://api\.alldebrid\.com/v4/magnet/upload")
+
+INSTANT_RESPONSE = {
+    "status": "success",
+    "data": {
+        "magnets": [
+            {
+                "magnet": "aaaa",
+                "hash": "aaaa",
+                "instant": True,
+                "files": [{"n": "Movie.2020.1080p.mkv", "s": 2000000000}],
+            },
+            {"magnet": "bbbb", "hash": "bbbb", "instant": False, "files": []},
+        ]
+    },
+}
+ERROR_RESPONSE = {
+    "status": "error",
+    "error": {"code": "AUTH_BAD_APIKEY", "message": "The auth apikey is invalid"},
+}
+STATUS_RESPONSE = {"status": "success", "data": {"magnets": []}}
+UPLOAD_RESPONSE = {
+    "status": "success",
+    "data": {
+        "magnets": [
+            {
+                "id": 1,
+                "magnet": "cccc",
+                "hash": "cccc",
+                "name": "Movie.2020.1080p",
+                "size": 2000000000,
+                "ready": True,
+            }
+        ]
+    },
+}
+
+
+def request_count(mock_http: aioresponses) -> int:
+    return sum(len(calls) for calls in mock_http.requests.values())
+
+
+class TestAllDebridCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        db.redis = StrictRedis()
+        self.assertTrue(db.redis.ping())
+        self.debrid = AllDebridProvider(api_key="key", source_ip="127.0.0.1")
+
+    async def asyncTearDown(self):
+        db.redis.flushall()
+        await DebridService.close_http_session()
+
+    async def test_cached_torrents_hit_skips_request(self):
+        with aioresponses() as mock_http:
+            mock_http.post(INSTANT_URL, payload=INSTANT_RESPONSE)
+            first = await self.debrid.get_cached_torrents(["aaaa", "bbbb"])
+            second = await self.debrid.get_cached_torrents(["aaaa", "bbbb"])
+            self.assertEqual(request_count(mock_http), 1)
+
+        self.assertEqual([m.hash for m in first], ["aaaa"])
+        self.assertEqual(first, second)
+
+    async def test_cached_torrents_are_keyed_by_hashes(self):
+        with aioresponses() as mock_http:
+            mock_http.post(INSTANT_URL, payload=INSTANT_RESPONSE, repeat=True)
+            await self.debrid.get_cached_torrents(["aaaa", "bbbb"])
+            await self.debrid.get_cached_torrents(["bbbb", "aaaa"])
+            self.assertEqual(request_count(mock_http), 2)
+
+    async def test_cached_torrents_error_is_not_cached(self):
+        with aioresponses() as mock_http:
+            mock_http.post(INSTANT_URL, payload=ERROR_RESPONSE, repeat=True)
+            self.assertEqual(await self.debrid.get_cached_torrents(["aaaa"]), [])
+            self.assertEqual(await self.debrid.get_cached_torrents(["aaaa"]), [])
+            self.assertEqual(request_count(mock_http), 2)
+
+    async def test_status_listing_hit_skips_request(self):
+        with aioresponses() as mock_http:
+            mock_http.get(STATUS_URL, payload=STATUS_RESPONSE)
+            first = await self.debrid.get_torrent_info()
+            second = await self.debrid.get_torrent_info()
+            self.assertEqual(request_count(mock_http), 1)
+
+        self.assertEqual(first, second)
+
+    async def test_status_of_one_torrent_is_not_cached(self):
+        with aioresponses() as mock_http:
+            mock_http.get(STATUS_URL, payload=STATUS_RESPONSE, repeat=True)
+            await self.debrid.get_torrent_info(torrent_id=1)
+            await self.debrid.get_torrent_info(torrent_id=1)
+            self.assertEqual(request_count(mock_http), 2)
+        self.assertIsNone(db.redis.get(self.debrid.status_cache_key()))
+
+    async def test_status_listing_is_keyed_by_api_key(self):
+        other = AllDebridProvider(api_key="other", source_ip="127.0.0.1")
+        self.assertNotEqual(self.debrid.status_cache_key(), other.status_cache_key())
+
+    async def test_add_torrent_drops_status_listing(self):
+        with aioresponses() as mock_http:
+            mock_http.get(STATUS_URL, payload=STATUS_RESPONSE, repeat=True)
+            mock_http.post(UPLOAD_URL, payload=UPLOAD_RESPONSE)
+            await self.debrid.get_torrent_info()
+            self.assertIsNotNone(db.redis.get(self.debrid.status_cache_key()))
+
+            added = await self.debrid.add_torrent("cccc")
+            self.assertIsNone(db.redis.get(self.debrid.status_cache_key()))
+
+            await self.debrid.get_torrent_info()
+            self.assertEqual(request_count(mock_http), 3)
+
+        self.assertIsNotNone(added)
+        self.assertEqual([m.hash for m in added.magnets] if added else [], ["cccc"])
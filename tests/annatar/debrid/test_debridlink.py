@@ -0,0 +1,55 @@
+import re
+import unittest
+
+from aioresponses import aioresponses
+from redislite.client import StrictRedis
+
+from annatar.database import db
+from annatar.debrid.debrid_service import DebridService
+from annatar.debrid.debridlink import DebridLink
+
+CACHED_URL = re.compile(r"^https://debrid-link\.com/api/v2/seedbox/cached")
+
+CACHED_RESPONSE = {
+    "success": True,
+    "value": {
+        "magnet:?xt=urn:btih:aaaa": {
+            "name": "Movie.2020.1080p",
+            "hashString": "aaaa",
+            "files": [{"name": "Movie.2020.1080p.mkv", "size": 2000000000}],
+        }
+    },
+}
+FAILED_RESPONSE = {"success": False, "value": {}}
+
+
+def request_count(mock_http: aioresponses) -> int:
+    return sum(len(calls) for calls in mock_http.requests.values())
+
+
+class TestDebridLinkCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        db.redis = StrictRedis()
+        self.assertTrue(db.redis.ping())
+        self.debrid = DebridLink(api_key="key", source_ip="127.0.0.1")
+
+    async def asyncTearDown(self):
+        db.redis.flushall()
+        await DebridService.close_http_session()
+
+    async def test_cached_torrents_hit_skips_request(self):
+        with aioresponses() as mock_http:
+            mock_http.get(CACHED_URL, payload=CACHED_RESPONSE)
+            first = await self.debrid.get_cached_torrents(["aaaa"])
+            second = await self.debrid.get_cached_torrents(["aaaa"])
+            self.assertEqual(request_count(mock_http), 1)
+
+        self.assertEqual(list((first or {}).keys()), ["magnet:?xt=urn:btih:aaaa"])
+        self.assertEqual(first, second)
+
+    async def test_failed_response_is_not_cached(self):
+        with aioresponses() as mock_http:
+            mock_http.get(CACHED_URL, payload=FAILED_RESPONSE, repeat=True)
+            self.assertIsNone(await self.debrid.get_cached_torrents(["aaaa"]))
+            self.assertIsNone(await self.debrid.get_cached_torrents(["aaaa"]))
+            self.assertEqual(request_count(mock_http), 2)
@@ -0,0 +1,57 @@
+import unittest
+
+from aioresponses import aioresponses
+
+from annatar.debrid import real_debrid_api as api
+from annatar.debrid.debrid_service import DebridService
+from annatar.debrid.rd_models import InstantFile
+
+HASHES = ["aaaa", "BBBB", "cccc"]
+AVAILABILITY_URL = f"{api.ROOT_URL}/torrents/instantAvailability/aaaa/BBBB/cccc"
+
+
+class TestGetInstantAvailability(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await DebridService.close_http_session()
+
+    async def test_looks_up_every_hash_in_one_request(self):
+        with aioresponses() as mock_http:
+            mock_http.get(
+                AVAILABILITY_URL,
+                payload={
+                    "AaAa": {
+                        "rd": [
+                            {
+                                "1": {"filename": "Show.S01E01.mkv", "filesize": 100},
+                                "2": {"filename": "Show.S01E02.mkv", "filesize": 200},
+                            },
+                            {"3": {"filename": "Show.S01.mkv", "filesize": 300}},
+                        ]
+                    },
+                    "bbbb": [],
+                    "cccc": {"rd": []},
+                },
+            )
+            availability = await api.get_instant_availability(HASHES, "token")
+            requests = sum(len(calls) for calls in mock_http.requests.values())
+
+        self.assertEqual(requests, 1)
+        self.assertEqual(
+            availability,
+            {
+                "AAAA": [
+                    [
+                        InstantFile(id=1, filename="Show.S01E01.mkv", filesize=100),
+                        InstantFile(id=2, filename="Show.S01E02.mkv", filesize=200),
+                    ],
+                    [InstantFile(id=3, filename="Show.S01.mkv", filesize=300)],
+                ],
+                "CCCC": [],
+            },
+        )
+        self.assertNotIn("BBBB", availability)
+
+    async def test_returns_nothing_when_the_request_fails(self):
+        with aioresponses() as mock_http:
+            mock_http.get(AVAILABILITY_URL, status=503, body="unavailable")
+            self.assertEqual(await api.get_instant_availability(HASHES, "token"), {})
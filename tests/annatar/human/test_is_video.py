@@ -0,0 +1,20 @@
+import unittest
+
+from annatar.human import is_video
+
+GB = 1024 * 1024 * 1024
+
+
+class TestIsVideo(unittest.TestCase):
+    def test_matches_video_extension(self):
+        self.assertTrue(is_video("Foobar.S01E01.1080p.mkv", GB))
+
+    def test_matches_upper_case_extension(self):
+        self.assertTrue(is_video("Foobar.S01E01.1080p.MKV", GB))
+
+    def test_does_not_match_other_extensions(self):
+        self.assertFalse(is_video("Foobar.S01E01.1080p.nfo", GB))
+        self.assertFalse(is_video("Foobar", GB))
+
+    def test_does_not_match_small_files(self):
+        self.assertFalse(is_video("Foobar.S01E01.sample.mkv", 1024))
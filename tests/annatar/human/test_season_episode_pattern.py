@@ -0,0 +1,33 @@
+import unittest
+
+from annatar.human import prefer_season_episode, season_episode_pattern
+
+
+class TestSeasonEpisodePattern(unittest.TestCase):
+    def test_matches_leading_zeros(self):
+        self.assertTrue(season_episode_pattern(1, 2).search("The.Mandalorian.S01E02.1080p"))
+
+    def test_matches_without_leading_zeros(self):
+        self.assertTrue(season_episode_pattern(1, 2).search("The.Mandalorian.S1E2.1080p"))
+
+    def test_matches_separated(self):
+        self.assertTrue(season_episode_pattern(1, 2).search("The.Mandalorian.S01.E02.1080p"))
+
+    def test_does_not_match_longer_episode(self):
+        self.assertFalse(season_episode_pattern(1, 1).search("The.Mandalorian.S01E10.1080p"))
+
+    def test_does_not_match_other_season(self):
+        self.assertFalse(season_episode_pattern(1, 2).search("The.Mandalorian.S11E02.1080p"))
+
+
+class TestPreferSeasonEpisode(unittest.TestCase):
+    files = ["Show.S01E01.mkv", "Show.S01E02.mkv", "Show.S01E02.sample.mkv", "extras.mkv"]
+
+    def test_moves_matching_files_first_keeping_order(self):
+        self.assertEqual(
+            prefer_season_episode(self.files, lambda f: f, 1, 2),
+            ["Show.S01E02.mkv", "Show.S01E02.sample.mkv", "Show.S01E01.mkv", "extras.mkv"],
+        )
+
+    def test_keeps_order_without_season_and_episode(self):
+        self.assertEqual(prefer_season_episode(self.files, lambda f: f, 0, 0), self.files)
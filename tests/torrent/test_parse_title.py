@@ -0,0 +1,16 @@
+import unittest
+
+from annatar.torrent import TorrentMeta
+
+
+class TestParseTitle(unittest.TestCase):
+    def test_returns_copies_of_cached_results(self):
+        title = "Friends S05E10 1994 1080p"
+        first = TorrentMeta.parse_title(title)
+        first.match_score(title="Friends", year=1994, season=5, episode=10)
+        first.resolution.clear()
+
+        second = TorrentMeta.parse_title(title)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.resolution, ["1080p"])
+        self.assertEqual(second.year, [1994])